@@ -271,6 +271,31 @@ except NameError:
     unicode = str
 
 
+try:
+    from functools import lru_cache
+except ImportError:
+    def lru_cache(maxsize=128):
+        # Python 2 doesn't have an lru_cache, just don't cache there.
+        return lambda func: func
+
+
+# intern function
+if is_py3:
+    _intern = sys.intern
+else:
+    _intern = intern  # noqa: F821
+
+
+def intern_str(string):
+    """
+    Interns native strings. Everything else (e.g. unicode on Python 2) cannot
+    be interned and is returned unchanged.
+    """
+    if isinstance(string, str):
+        return _intern(string)
+    return string
+
+
 # re-raise function
 if is_py3:
     def reraise(exception, traceback):
@@ -5,11 +5,12 @@ the interesting information about completion and goto operations.
 """
 import re
 import warnings
+from itertools import chain
 
 from parso.python.tree import search_ancestor
 
 from jedi import settings
-from jedi.evaluate.utils import unite
+from jedi._compatibility import intern_str
 from jedi.cache import memoize_method
 from jedi.evaluate import imports
 from jedi.evaluate import compiled
@@ -20,9 +21,49 @@ from jedi.evaluate.gradual.conversion import name_to_stub, \
     stub_to_actual_context_set, try_stubs_to_actual_context_set
 from jedi.api.keywords import KeywordName
 
+_COMMENT_PATTERN = re.compile(r'#[^\n]+\n')
+
+_NAME_MAPPING = {
+    'posixpath': 'os.path',
+    'riscospath': 'os.path',
+    'ntpath': 'os.path',
+    'os2emxpath': 'os.path',
+    'macpath': 'os.path',
+    'genericpath': 'os.path',
+    'posix': 'os',
+    '_io': 'io',
+    '_functools': 'functools',
+    '_sqlite3': 'sqlite3',
+    '__builtin__': 'builtins',
+}
+
+_TUPLE_MAPPING = dict((tuple(k.split('.')), v) for (k, v) in {
+    'argparse._ActionsContainer': 'argparse.ArgumentParser',
+}.items())
+
+
+def _normalize_description(txt):
+    if '#' in txt:
+        # Delete comments:
+        txt = _COMMENT_PATTERN.sub(' ', txt)
+    # Delete multi spaces/newlines
+    return ' '.join(txt.split())
+
+
+def _start_pos_key(name):
+    return name.start_pos or (0, 0)
+
 
 def _sort_names_by_start_pos(names):
-    return sorted(names, key=lambda s: s.start_pos or (0, 0))
+    return sorted(names, key=_start_pos_key)
+
+
+def _sorted_sub_names(contexts):
+    names = chain.from_iterable(
+        next(context.get_filters(search_global=True)).values()
+        for context in contexts
+    )
+    return _sort_names_by_start_pos(names)
 
 
 def defined_names(evaluator, context):
@@ -32,29 +73,12 @@ def defined_names(evaluator, context):
     :type scope: Scope
     :rtype: list of Definition
     """
-    filter = next(context.get_filters(search_global=True))
-    names = [name for name in filter.values()]
-    return [Definition(evaluator, n) for n in _sort_names_by_start_pos(names)]
+    return [Definition(evaluator, n) for n in _sorted_sub_names([context])]
 
 
 class BaseDefinition(object):
-    _mapping = {
-        'posixpath': 'os.path',
-        'riscospath': 'os.path',
-        'ntpath': 'os.path',
-        'os2emxpath': 'os.path',
-        'macpath': 'os.path',
-        'genericpath': 'os.path',
-        'posix': 'os',
-        '_io': 'io',
-        '_functools': 'functools',
-        '_sqlite3': 'sqlite3',
-        '__builtin__': 'builtins',
-    }
-
-    _tuple_mapping = dict((tuple(k.split('.')), v) for (k, v) in {
-        'argparse._ActionsContainer': 'argparse.ArgumentParser',
-    }.items())
+    __slots__ = ('_evaluator', '_name', 'is_keyword', '_tree_name',
+                 '_string_name', '_is_context_name', '_memoize_method_dct')
 
     def __init__(self, evaluator, name):
         self._evaluator = evaluator
@@ -63,6 +87,19 @@ class BaseDefinition(object):
         An instance of :class:`parso.python.tree.Name` subclass.
         """
         self.is_keyword = isinstance(self._name, KeywordName)
+        self._tree_name = name.tree_name
+        self._is_context_name = name.is_context_name
+        # Names are compared and hashed a lot by users of the API, which is
+        # cheaper for interned strings.
+        self._string_name = intern_str(name.string_name)
+
+    @memoize_method
+    def _get_tree_definition(self):
+        # ``get_definition`` walks up the parser tree, which is not for free
+        # and is needed in multiple places.
+        if self._tree_name is None:
+            return None
+        return self._tree_name.get_definition()
 
     @memoize_method
     def _get_module(self):
@@ -90,9 +127,10 @@ class BaseDefinition(object):
 
         :rtype: str or None
         """
-        return self._name.string_name
+        return self._string_name
 
     @property
+    @memoize_method
     def type(self):
         """
         The type of the definition.
@@ -147,13 +185,12 @@ class BaseDefinition(object):
         'function'
 
         """
-        tree_name = self._name.tree_name
         resolve = False
-        if tree_name is not None:
+        if self._tree_name is not None:
             # TODO move this to their respective names.
-            definition = tree_name.get_definition()
+            definition = self._get_tree_definition()
             if definition is not None and definition.type == 'import_from' and \
-                    tree_name.is_definition():
+                    self._tree_name.is_definition():
                 resolve = True
 
         if isinstance(self._name, imports.SubModuleName) or resolve:
@@ -162,6 +199,7 @@ class BaseDefinition(object):
         return self._name.api_type
 
     @property
+    @memoize_method
     def module_name(self):
         """
         The module name.
@@ -173,14 +211,19 @@ class BaseDefinition(object):
         >>> print(d.module_name)  # doctest: +ELLIPSIS
         json
         """
-        return self._get_module().name.string_name
+        return intern_str(self._get_module().name.string_name)
 
+    @memoize_method
     def in_builtin_module(self):
         """Whether this is a builtin module."""
-        if isinstance(self._get_module(), StubModuleContext):
-            return any(isinstance(context, compiled.CompiledObject)
-                       for context in self._get_module().non_stub_context_set)
-        return isinstance(self._get_module(), compiled.CompiledObject)
+        module = self._get_module()
+        # CompiledObject has no subclasses, so a type check is enough.
+        if isinstance(module, StubModuleContext):
+            for context in module.non_stub_context_set:
+                if type(context) is compiled.CompiledObject:
+                    return True
+            return False
+        return type(module) is compiled.CompiledObject
 
     @property
     def line(self):
@@ -198,6 +241,7 @@ class BaseDefinition(object):
             return None
         return start_pos[1]
 
+    @memoize_method
     def docstring(self, raw=False, fast=True):
         r"""
         Return a document string for this completion object.
@@ -234,9 +278,10 @@ class BaseDefinition(object):
     @property
     def description(self):
         """A textual description of the object."""
-        return self._name.string_name
+        return self._string_name
 
     @property
+    @memoize_method
     def full_name(self):
         """
         Dot-separated path of this object.
@@ -260,28 +305,26 @@ class BaseDefinition(object):
         be ``<module 'posixpath' ...>```. However most users find the latter
         more practical.
         """
-        if not self._name.is_context_name:
+        if not self._is_context_name:
             return None
 
         names = self._name.get_qualified_names(include_module_names=True)
         if names is None:
             return names
 
-        names = list(names)
-        try:
-            names[0] = self._mapping[names[0]]
-        except KeyError:
-            pass
-
-        return '.'.join(names)
+        head = _NAME_MAPPING.get(names[0], names[0])
+        if len(names) == 1:
+            return head
+        return head + '.' + '.'.join(names[1:])
 
+    @memoize_method
     def is_stub(self):
-        if not self._name.is_context_name:
+        if not self._is_context_name:
             return False
         return all(c.is_stub() for c in self._name.infer())
 
     def goto_stubs(self):
-        if not self._name.is_context_name:
+        if not self._is_context_name:
             return []
 
         if self.is_stub():
@@ -293,14 +336,14 @@ class BaseDefinition(object):
         ]
 
     def goto_assignments(self):
-        if not self._name.is_context_name:
+        if not self._is_context_name:
             return []
 
         return [self if n == self._name else Definition(self._evaluator, n)
                 for n in self._name.goto()]
 
     def infer(self):
-        if not self._name.is_context_name:
+        if not self._is_context_name:
             return []
 
         # Param names are special because they are not handled by
@@ -331,7 +374,7 @@ class BaseDefinition(object):
         raise AttributeError('There are no params defined on this.')
 
     def parent(self):
-        if not self._name.is_context_name:
+        if not self._is_context_name:
             return None
 
         context = self._name.parent_context
@@ -359,7 +402,7 @@ class BaseDefinition(object):
         :return str: Returns the line(s) of code or an empty string if it's a
                      builtin.
         """
-        if not self._name.is_context_name or self.in_builtin_module():
+        if not self._is_context_name or self.in_builtin_module():
             return ''
 
         lines = self._name.get_root_context().code_lines
@@ -374,6 +417,8 @@ class Completion(BaseDefinition):
     `Completion` objects are returned from :meth:`api.Script.completions`. They
     provide additional information about a completion.
     """
+    __slots__ = ('_like_name_length', '_stack', '_same_name_completions')
+
     def __init__(self, evaluator, name, stack, like_name_length):
         super(Completion, self).__init__(evaluator, name)
 
@@ -381,25 +426,44 @@ class Completion(BaseDefinition):
         self._stack = stack
 
         # Completion objects with the same Completion name (which means
-        # duplicate items in the completion)
-        self._same_name_completions = []
+        # duplicate items in the completion). Most completions don't have
+        # any, so the list is only created when needed.
+        self._same_name_completions = None
 
-    def _complete(self, like_name):
+    def _add_same_name_completion(self, completion):
+        if self._same_name_completions is None:
+            self._same_name_completions = [completion]
+        else:
+            self._same_name_completions.append(completion)
+
+    @memoize_method
+    def _get_append(self):
+        # The appended symbols are the same for `complete` and
+        # `name_with_symbols`, so only calculate them once.
         append = ''
         if settings.add_bracket_after_function \
                 and self.type == 'function':
             append = '('
 
         if self._name.api_type == 'param' and self._stack is not None:
-            nonterminals = [stack_node.nonterminal for stack_node in self._stack]
-            if 'trailer' in nonterminals and 'argument' not in nonterminals:
-                # TODO this doesn't work for nested calls.
-                append += '='
+            has_trailer = False
+            for stack_node in self._stack:
+                nonterminal = stack_node.nonterminal
+                if nonterminal == 'argument':
+                    break
+                if nonterminal == 'trailer':
+                    has_trailer = True
+            else:
+                if has_trailer:
+                    # TODO this doesn't work for nested calls.
+                    append += '='
+        return append
 
-        name = self._name.string_name
+    def _complete(self, like_name):
+        name = self._string_name
         if like_name:
             name = name[self._like_name_length:]
-        return name + append
+        return name + self._get_append()
 
     @property
     def complete(self):
@@ -479,6 +543,8 @@ class Definition(BaseDefinition):
     *Definition* objects are returned from :meth:`api.Script.goto_assignments`
     or :meth:`api.Script.goto_definitions`.
     """
+    __slots__ = ()
+
     def __init__(self, evaluator, definition):
         super(Definition, self).__init__(evaluator, definition)
 
@@ -513,12 +579,12 @@ class Definition(BaseDefinition):
 
         """
         typ = self.type
-        tree_name = self._name.tree_name
+        tree_name = self._tree_name
         if typ in ('function', 'class', 'module', 'instance') or tree_name is None:
             if typ == 'function':
                 # For the description we want a short and a pythonic way.
                 typ = 'def'
-            return typ + ' ' + self._name.string_name
+            return typ + ' ' + self._string_name
         elif typ == 'param':
             code = search_ancestor(tree_name, 'param').get_code(
                 include_prefix=False,
@@ -526,15 +592,10 @@ class Definition(BaseDefinition):
             )
             return typ + ' ' + code
 
-        definition = tree_name.get_definition() or tree_name
+        definition = self._get_tree_definition() or tree_name
         # Remove the prefix, because that's not what we want for get_code
         # here.
-        txt = definition.get_code(include_prefix=False)
-        # Delete comments:
-        txt = re.sub(r'#[^\n]+\n', ' ', txt)
-        # Delete multi spaces/newlines
-        txt = re.sub(r'\s+', ' ', txt).strip()
-        return txt
+        return _normalize_description(definition.get_code(include_prefix=False))
 
     @property
     def desc_with_module(self):
@@ -558,32 +619,48 @@ class Definition(BaseDefinition):
         :rtype: list of Definition
         """
         defs = self._name.infer()
-        return sorted(
-            unite(defined_names(self._evaluator, d) for d in defs),
-            key=lambda s: s._name.start_pos or (0, 0)
-        )
+        if len(defs) == 1:
+            # The names of a single context are already unique.
+            return defined_names(self._evaluator, next(iter(defs)))
+
+        # Collect the names of all inferred contexts first, so that they
+        # only need to be sorted once.
+        result = []
+        seen = set()
+        for name in _sorted_sub_names(defs):
+            definition = Definition(self._evaluator, name)
+            if definition not in seen:
+                seen.add(definition)
+                result.append(definition)
+        return result
 
+    @memoize_method
     def is_definition(self):
         """
         Returns True, if defined as a name in a statement, function or class.
         Returns False, if it's a reference to such a definition.
         """
-        if self._name.tree_name is None:
+        if self._tree_name is None:
             return True
         else:
-            return self._name.tree_name.is_definition()
+            return self._tree_name.is_definition()
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        # The module path is the most expensive to compute, so check it last.
         return self._name.start_pos == other._name.start_pos \
-            and self.module_path == other.module_path \
             and self.name == other.name \
-            and self._evaluator == other._evaluator
+            and self._evaluator == other._evaluator \
+            and self.module_path == other.module_path
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
     def __hash__(self):
-        return hash((self._name.start_pos, self.module_path, self.name, self._evaluator))
+        # Leaving out the module path is fine, since equal definitions still
+        # have equal hashes.
+        return hash((self._name.start_pos, self.name, self._evaluator))
 
 
 class CallSignature(Definition):
@@ -592,6 +669,8 @@ class CallSignature(Definition):
     It knows what functions you are currently in. e.g. `isinstance(` would
     return the `isinstance` function. without `(` it would return nothing.
     """
+    __slots__ = ('_index', '_key_name_str', '_bracket_start_pos', '_signature')
+
     def __init__(self, evaluator, signature, bracket_start_pos, index, key_name_str):
         super(CallSignature, self).__init__(evaluator, signature.name)
         self._index = index
@@ -605,28 +684,36 @@ class CallSignature(Definition):
         The Param index of the current call.
         Returns None if the index cannot be found in the curent call.
         """
+        params = self.params
         if self._key_name_str is not None:
-            for i, param in enumerate(self.params):
-                if self._key_name_str == param.name:
-                    return i
-            if self.params:
-                param_name = self.params[-1]._name
-                if param_name.tree_name is not None:
-                    if param_name.tree_name.get_definition().star_count == 2:
-                        return i
+            index = self._get_param_indexes().get(self._key_name_str)
+            if index is not None:
+                return index
+            if params:
+                param = params[-1]
+                if param._tree_name is not None:
+                    if param._get_tree_definition().star_count == 2:
+                        return len(params) - 1
             return None
 
-        if self._index >= len(self.params):
-            for i, param in enumerate(self.params):
-                tree_name = param._name.tree_name
-                if tree_name is not None:
+        if self._index >= len(params):
+            for i, param in enumerate(params):
+                if param._tree_name is not None:
                     # *args case
-                    if tree_name.get_definition().star_count == 1:
+                    if param._get_tree_definition().star_count == 1:
                         return i
             return None
         return self._index
 
+    @memoize_method
+    def _get_param_indexes(self):
+        indexes = {}
+        for i, param in enumerate(self.params):
+            indexes.setdefault(param.name, i)
+        return indexes
+
     @property
+    @memoize_method
     def params(self):
         return [Definition(self._evaluator, n) for n in self._signature.get_param_names()]
 
@@ -653,10 +740,10 @@ class CallSignature(Definition):
 
 
 def _format_signatures(context):
-    return '\n'.join(
+    return '\n'.join([
         signature.to_string()
         for signature in context.get_signatures()
-    )
+    ])
 
 
 class _Help(object):
@@ -703,9 +790,11 @@ class _Help(object):
                         if doc:
                             break
 
-            if signature_text and doc:
+            if not signature_text:
+                full_doc += doc
+            elif doc:
                 full_doc += signature_text + '\n\n' + doc
             else:
-                full_doc += signature_text + doc
+                full_doc += signature_text
 
         return full_doc
@@ -43,7 +43,7 @@ def filter_names(evaluator, completion_names, stack, like_name):
             )
             k = (new.name, new.complete)  # key
             if k in comp_dct and settings.no_completion_duplicates:
-                comp_dct[k]._same_name_completions.append(new)
+                comp_dct[k]._add_same_name_completion(new)
             else:
                 comp_dct[k] = new
                 yield new
@@ -95,10 +95,7 @@ class Completion:
 
         # Some hacks to increase speed of Jedi
         current_line = self._code_lines[position[0] - 1]
-        if '.' not in current_line and '(' not in current_line:
-            init_speed_hacks(True)
-        else:
-            init_speed_hacks(False)
+        self._speed_hacks = '.' not in current_line and '(' not in current_line
 
         self._position = position[0], position[1] - len(self._like_name)
         self._call_signatures_method = call_signatures_method
@@ -235,9 +232,16 @@ class Completion:
             self._position,
             origin_scope=flow_scope_node
         )
-        completion_names = []
-        for filter in filters:
-            completion_names += filter.values()
+        # The speed hacks skip name lookups, which is only acceptable while
+        # collecting the names of the global filters. Everything else (e.g.
+        # base classes and later API calls) needs the actual results.
+        init_speed_hacks(self._speed_hacks)
+        try:
+            completion_names = []
+            for filter in filters:
+                completion_names += filter.values()
+        finally:
+            init_speed_hacks(False)
         return completion_names
 
     def _trailer_completions(self, previous_leaf):
@@ -18,6 +18,10 @@ from jedi import settings
 from parso.cache import parser_cache
 
 _time_caches = {}
+# The key memoize_method uses for calls without arguments, which is by far
+# the most common case (e.g. memoized properties).
+_NO_ARGUMENTS_KEY = ((), frozenset())
+_object_getattribute = object.__getattribute__
 
 
 def underscore_memoization(func):
@@ -131,12 +135,32 @@ def time_cache(seconds):
 
 
 def memoize_method(method):
-    """A normal memoize function."""
+    """
+    A normal memoize function. Classes using ``__slots__`` need to define a
+    ``_memoize_method_dct`` slot.
+    """
     @wraps(method)
     def wrapper(self, *args, **kwargs):
-        cache_dict = self.__dict__.setdefault('_memoize_method_dct', {})
-        dct = cache_dict.setdefault(method, {})
-        key = (args, frozenset(kwargs.items()))
+        try:
+            # Bypass __getattr__, wrappers would otherwise use the cache of
+            # the wrapped object.
+            cache_dict = _object_getattribute(self, '_memoize_method_dct')
+        except AttributeError:
+            cache_dict = {}
+            try:
+                self._memoize_method_dct = cache_dict
+            except AttributeError:
+                raise AttributeError(
+                    "%s defines __slots__ without a _memoize_method_dct slot, "
+                    "which memoize_method needs." % self.__class__.__name__
+                )
+        dct = cache_dict.get(method)
+        if dct is None:
+            dct = cache_dict[method] = {}
+        if args or kwargs:
+            key = (args, frozenset(kwargs.items()))
+        else:
+            key = _NO_ARGUMENTS_KEY
         try:
             return dct[key]
         except KeyError:
@@ -1,4 +1,6 @@
 class BaseContext(object):
+    __slots__ = ('evaluator', 'parent_context')
+
     def __init__(self, evaluator, parent_context=None):
         self.evaluator = evaluator
         self.parent_context = parent_context
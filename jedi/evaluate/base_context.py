@@ -23,6 +23,8 @@ _sentinel = object()
 
 
 class HelperContextMixin(object):
+    __slots__ = ()
+
     def get_root_context(self):
         context = self
         while True:
@@ -114,6 +116,7 @@ class Context(HelperContextMixin, BaseContext):
     """
     Should be defined, otherwise the API returns empty types.
     """
+    __slots__ = ()
     predefined_names = {}
     """
     To be defined by subclasses.
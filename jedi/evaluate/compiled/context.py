@@ -6,8 +6,9 @@ from functools import partial
 
 from jedi import debug
 from jedi.evaluate.utils import to_list
-from jedi._compatibility import force_unicode, Parameter, cast_path
-from jedi.cache import underscore_memoization, memoize_method
+from jedi._compatibility import force_unicode, Parameter, cast_path, \
+    lru_cache, intern_str
+from jedi.cache import memoize_method
 from jedi.evaluate.filters import AbstractFilter
 from jedi.evaluate.names import AbstractNameDefinition, ContextNameMixin, \
     ParamNameInterface
@@ -17,6 +18,7 @@ from jedi.evaluate.compiled.access import _sentinel
 from jedi.evaluate.cache import evaluator_function_cache
 from jedi.evaluate.helpers import reraise_getitem_errors, execute_evaluated
 from jedi.evaluate.signature import BuiltinSignature
+from jedi.evaluate import docstrings
 
 
 class CheckAttribute(object):
@@ -35,29 +37,38 @@ class CheckAttribute(object):
         if instance is None:
             return self
 
-        # This might raise an AttributeError. That's wanted.
-        instance.access_handle.getattr_paths(self.check_name)
+        if not instance._has_attribute(self.check_name):
+            raise AttributeError(self.check_name)
         return partial(self.func, instance)
 
 
 class CompiledObject(Context):
+    __slots__ = ('access_handle', '_parsed_function_doc', '_memoize_method_dct')
+
     def __init__(self, evaluator, access_handle, parent_context=None):
         super(CompiledObject, self).__init__(evaluator, parent_context)
         self.access_handle = access_handle
+        self._parsed_function_doc = None
 
-    def py__call__(self, arguments):
+    @memoize_method
+    def _has_attribute(self, name):
         try:
-            self.access_handle.getattr_paths(u'__call__')
+            self.access_handle.getattr_paths(name)
         except AttributeError:
+            return False
+        return True
+
+    def py__call__(self, arguments):
+        if not self._has_attribute(u'__call__'):
             return super(CompiledObject, self).py__call__(arguments)
+
+        if self.is_class():
+            from jedi.evaluate.context import CompiledInstance
+            return ContextSet([
+                CompiledInstance(self.evaluator, self.parent_context, self, arguments)
+            ])
         else:
-            if self.access_handle.is_class():
-                from jedi.evaluate.context import CompiledInstance
-                return ContextSet([
-                    CompiledInstance(self.evaluator, self.parent_context, self, arguments)
-                ])
-            else:
-                return ContextSet(self._execute_function(arguments))
+            return ContextSet(self._execute_function(arguments))
 
     @CheckAttribute()
     def py__class__(self):
@@ -79,7 +90,7 @@ class CompiledObject(Context):
 
     @CheckAttribute()
     def py__path__(self):
-        return map(cast_path, self.access_handle.py__path__())
+        return [cast_path(path) for path in self.access_handle.py__path__()]
 
     @property
     def string_names(self):
@@ -89,18 +100,22 @@ class CompiledObject(Context):
             return ()
         return tuple(name.split('.'))
 
+    @memoize_method
     def get_qualified_names(self):
         return self.access_handle.get_qualified_names()
 
+    @memoize_method
     def py__bool__(self):
         return self.access_handle.py__bool__()
 
     def py__file__(self):
         return cast_path(self.access_handle.py__file__())
 
+    @memoize_method
     def is_class(self):
         return self.access_handle.is_class()
 
+    @memoize_method
     def is_module(self):
         return self.access_handle.is_module()
 
@@ -110,9 +125,11 @@ class CompiledObject(Context):
     def is_stub(self):
         return False
 
+    @memoize_method
     def is_instance(self):
         return self.access_handle.is_instance()
 
+    @memoize_method
     def py__doc__(self):
         return self.access_handle.py__doc__()
 
@@ -122,10 +139,9 @@ class CompiledObject(Context):
             signature_params = self.access_handle.get_signature_params()
         except ValueError:  # Has no signature
             params_str, ret = self._parse_function_doc()
-            tokens = params_str.split(',')
             if self.access_handle.ismethoddescriptor():
-                tokens.insert(0, 'self')
-            for p in tokens:
+                yield UnresolvableParamName(self, u'self', u'')
+            for p in params_str.split(','):
                 name, _, default = p.strip().partition('=')
                 yield UnresolvableParamName(self, name, default)
         else:
@@ -139,19 +155,21 @@ class CompiledObject(Context):
     def __repr__(self):
         return '<%s: %s>' % (self.__class__.__name__, self.access_handle.get_repr())
 
-    @underscore_memoization
     def _parse_function_doc(self):
-        doc = self.py__doc__()
-        if doc is None:
-            return '', ''
-
-        return _parse_function_doc(doc)
+        # This is called a lot, so don't use a generic memoize decorator.
+        if self._parsed_function_doc is None:
+            doc = self.py__doc__()
+            if doc is None:
+                self._parsed_function_doc = '', ''
+            else:
+                self._parsed_function_doc = _parse_function_doc(doc)
+        return self._parsed_function_doc
 
     @property
+    @memoize_method
     def api_type(self):
         return self.access_handle.get_api_type()
 
-    @underscore_memoization
     def _cls(self):
         """
         We used to limit the lookups for instantiated objects like list(), but
@@ -187,10 +205,10 @@ class CompiledObject(Context):
             # This means basically that no __getitem__ has been defined on this
             # object.
             return super(CompiledObject, self).py__getitem__(index_context_set, contextualized_node)
-        return ContextSet(
+        return ContextSet([
             create_from_access_path(self.evaluator, access)
             for access in all_access_paths
-        )
+        ])
 
     def py__iter__(self, contextualized_node=None):
         # Python iterators are a bit strange, because there's no need for
@@ -209,7 +227,10 @@ class CompiledObject(Context):
         for access in access_path_list:
             yield LazyKnownContext(create_from_access_path(self.evaluator, access))
 
+    @memoize_method
     def py__name__(self):
+        # Both ``name`` and ``string_names`` need this, which means an access
+        # call (possibly to a subprocess) each time.
         return self.access_handle.py__name__()
 
     @property
@@ -220,7 +241,6 @@ class CompiledObject(Context):
         return CompiledContextName(self, name)
 
     def _execute_function(self, params):
-        from jedi.evaluate import docstrings
         from jedi.evaluate.compiled import builtin_from_name
         if self.api_type != 'function':
             return
@@ -258,10 +278,13 @@ class CompiledObject(Context):
 
 
 class CompiledName(AbstractNameDefinition):
+    __slots__ = ('_evaluator', 'parent_context', 'string_name', '_inferred')
+
     def __init__(self, evaluator, parent_context, name):
         self._evaluator = evaluator
         self.parent_context = parent_context
         self.string_name = name
+        self._inferred = None
 
     def __repr__(self):
         try:
@@ -274,14 +297,17 @@ class CompiledName(AbstractNameDefinition):
     def api_type(self):
         return next(iter(self.infer())).api_type
 
-    @underscore_memoization
     def infer(self):
-        return ContextSet([_create_from_name(
-            self._evaluator, self.parent_context, self.string_name
-        )])
+        # This is called a lot, so don't use a generic memoize decorator.
+        if self._inferred is None:
+            self._inferred = ContextSet([_create_from_name(
+                self._evaluator, self.parent_context, self.string_name
+            )])
+        return self._inferred
 
 
 class SignatureParamName(AbstractNameDefinition, ParamNameInterface):
+    __slots__ = ('parent_context', '_signature_param')
     api_type = u'param'
 
     def __init__(self, compiled_obj, signature_param):
@@ -319,6 +345,7 @@ class SignatureParamName(AbstractNameDefinition, ParamNameInterface):
 
 
 class UnresolvableParamName(AbstractNameDefinition, ParamNameInterface):
+    __slots__ = ('parent_context', 'string_name', '_default')
     api_type = u'param'
 
     def __init__(self, compiled_obj, name, default):
@@ -340,6 +367,8 @@ class UnresolvableParamName(AbstractNameDefinition, ParamNameInterface):
 
 
 class CompiledContextName(ContextNameMixin, AbstractNameDefinition):
+    __slots__ = ('string_name', '_context', 'parent_context', '_memoize_method_dct')
+
     def __init__(self, context, name):
         self.string_name = name
         self._context = context
@@ -352,6 +381,8 @@ class EmptyCompiledName(AbstractNameDefinition):
     completions, just give Jedi the option to return this object. It infers to
     nothing.
     """
+    __slots__ = ('parent_context', 'string_name')
+
     def __init__(self, evaluator, name):
         self.parent_context = evaluator.builtins_module
         self.string_name = name
@@ -361,6 +392,8 @@ class EmptyCompiledName(AbstractNameDefinition):
 
 
 class CompiledObjectFilter(AbstractFilter):
+    __slots__ = ('_evaluator', '_compiled_object', 'is_instance',
+                 '_memoize_method_dct')
     name_class = CompiledName
 
     def __init__(self, evaluator, compiled_object, is_instance=False):
@@ -405,12 +438,16 @@ class CompiledObjectFilter(AbstractFilter):
         from jedi.evaluate.compiled import builtin_from_name
         names = []
         needs_type_completions, dir_infos = self._compiled_object.access_handle.get_dir_infos()
-        for name in dir_infos:
-            names += self._get(
-                name,
-                lambda: dir_infos[name],
-                lambda: dir_infos.keys(),
-            )
+        # This is the same as ``_get``, but inlined, because it's called for
+        # every name of the object. The ``dir`` check of ``_get`` for
+        # instances is not needed, because the names come from ``dir``.
+        for name, (has_attribute, is_descriptor) in dir_infos.items():
+            # Always use unicode objects in Python 2 from here.
+            name = force_unicode(name)
+            if is_descriptor or not has_attribute:
+                names.append(self._get_cached_name(name, is_empty=True))
+            else:
+                names.append(self._get_cached_name(name))
 
         # ``dir`` doesn't include the type names.
         if not self.is_instance and needs_type_completions:
@@ -425,6 +462,12 @@ class CompiledObjectFilter(AbstractFilter):
         return "<%s: %s>" % (self.__class__.__name__, self._compiled_object)
 
 
+_PARENTHESES_PATTERN = re.compile(r'[()]')
+_OPTIONAL_PARAMS_PATTERN = re.compile(r' ?\[([^\[\]]+)\]')
+_RETURN_ARROW_PATTERN = re.compile(u'-[>-]* ')
+_RETURN_TYPE_PATTERN = re.compile(r'(,\n|[^\n-])+')
+_NEW_OBJECT_PATTERN = re.compile(r'[nN]ew (.*)')
+
 docstr_defaults = {
     'floating point number': u'float',
     'character': u'str',
@@ -434,6 +477,7 @@ docstr_defaults = {
 }
 
 
+@lru_cache(maxsize=2048)
 def _parse_function_doc(doc):
     """
     Takes a function and returns the params and return value as a tuple.
@@ -444,25 +488,27 @@ def _parse_function_doc(doc):
     """
     doc = force_unicode(doc)
     # parse round parentheses: def func(a, (b,c))
-    try:
+    end = None
+    start = doc.find('(')
+    if start != -1:
         count = 0
-        start = doc.index('(')
-        for i, s in enumerate(doc[start:]):
-            if s == '(':
+        for match in _PARENTHESES_PATTERN.finditer(doc, start):
+            if match.group() == '(':
                 count += 1
-            elif s == ')':
+            else:
                 count -= 1
             if count == 0:
-                end = start + i
+                end = match.start()
                 break
-        param_str = doc[start + 1:end]
-    except (ValueError, UnboundLocalError):
-        # ValueError for doc.index
-        # UnboundLocalError for undefined end in last line
+
+    if end is None:
+        # Either there's no bracket or it's never closed.
         debug.dbg('no brackets found - no param')
         end = 0
         param_str = u''
     else:
+        param_str = doc[start + 1:end]
+
         # remove square brackets, that show an optional param ( = None)
         def change_options(m):
             args = m.group(1).split(',')
@@ -472,25 +518,26 @@ def _parse_function_doc(doc):
             return ','.join(args)
 
         while True:
-            param_str, changes = re.subn(r' ?\[([^\[\]]+)\]',
-                                         change_options, param_str)
+            param_str, changes = _OPTIONAL_PARAMS_PATTERN.subn(change_options, param_str)
             if changes == 0:
                 break
     param_str = param_str.replace('-', '_')  # see: isinstance.__doc__
 
     # parse return value
-    r = re.search(u'-[>-]* ', doc[end:end + 7])
+    r = _RETURN_ARROW_PATTERN.search(doc[end:end + 7])
     if r is None:
         ret = u''
     else:
         index = end + r.end()
         # get result type, which can contain newlines
-        pattern = re.compile(r'(,\n|[^\n-])+')
-        ret_str = pattern.match(doc, index).group(0).strip()
+        ret_str = _RETURN_TYPE_PATTERN.match(doc, index).group(0).strip()
         # New object -> object()
-        ret_str = re.sub(r'[nN]ew (.*)', r'\1()', ret_str)
+        ret_str = _NEW_OBJECT_PATTERN.sub(r'\1()', ret_str)
 
-        ret = docstr_defaults.get(ret_str, ret_str)
+        ret = docstr_defaults.get(ret_str)
+        if ret is None:
+            # Return types like ``int`` are the same for a lot of docstrings.
+            ret = intern_str(ret_str)
 
     return param_str, ret
 
@@ -503,19 +550,10 @@ def _create_from_name(evaluator, compiled_object, name):
 
     context = None
     for access_path in access_paths:
-        context = create_cached_compiled_object(
-            evaluator, access_path, parent_context=context
-        )
+        context = create_cached_compiled_object(evaluator, access_path, context)
     return context
 
 
-def _normalize_create_args(func):
-    """The cache doesn't care about keyword vs. normal args."""
-    def wrapper(evaluator, obj, parent_context=None):
-        return func(evaluator, obj, parent_context)
-    return wrapper
-
-
 def create_from_access_path(evaluator, access_path):
     parent_context = None
     for name, access in access_path.accesses:
@@ -523,7 +561,8 @@ def create_from_access_path(evaluator, access_path):
     return parent_context
 
 
-@_normalize_create_args
 @evaluator_function_cache()
 def create_cached_compiled_object(evaluator, access_handle, parent_context):
+    # Always pass ``parent_context`` as a positional argument, otherwise the
+    # cache would treat it as a different call.
     return CompiledObject(evaluator, access_handle, parent_context)
@@ -221,7 +221,7 @@ def _create(evaluator, access_handle, parent_context, *args):
     compiled_object = create_cached_compiled_object(
         evaluator,
         access_handle,
-        parent_context=parent_context and parent_context.compiled_object
+        parent_context and parent_context.compiled_object
     )
 
     result = _find_syntax_node_name(evaluator, access_handle)
@@ -17,6 +17,7 @@ from jedi.evaluate.names import TreeNameDefinition, ParamName, AbstractNameDefin
 
 
 class AbstractFilter(object):
+    __slots__ = ()
     _until_position = None
 
     def _filter(self, names):
@@ -2,9 +2,11 @@ from jedi import debug
 from jedi.evaluate.base_context import ContextSet, \
     NO_CONTEXTS
 from jedi.evaluate.utils import to_list
+from jedi.evaluate.cache import evaluator_method_cache
 from jedi.evaluate.gradual.stub_context import StubModuleContext
 
 
+@evaluator_method_cache()
 def stub_to_actual_context_set(stub_context, ignore_compiled=False):
     stub_module = stub_context.get_root_context()
     if not stub_module.is_stub():
@@ -18,14 +20,31 @@ def stub_to_actual_context_set(stub_context, ignore_compiled=False):
     if qualified_names is None:
         return NO_CONTEXTS
 
-    was_bound_method = stub_context.is_bound_method()
+    return _infer_qualified_names(
+        _get_non_stubs(stub_module, ignore_compiled),
+        stub_context,
+        qualified_names,
+        was_instance,
+    )
+
+
+def _infer_qualified_names(contexts, context, qualified_names, was_instance):
+    """
+    Shared by the conversions in both directions: Looks up the qualified
+    names of ``context`` starting from the given (module) contexts.
+    """
+    if not qualified_names and not was_instance:
+        # This is a module, there's nothing to look up.
+        return contexts
+
+    was_bound_method = context.is_bound_method()
     if was_bound_method:
         # Infer the object first. We can infer the method later.
         method_name = qualified_names[-1]
         qualified_names = qualified_names[:-1]
         was_instance = True
 
-    contexts = _infer_from_stub(stub_module, qualified_names, ignore_compiled)
+    contexts = _follow_qualified_names(contexts, qualified_names)
     if was_instance:
         contexts = ContextSet.from_sets(
             c.execute_evaluated()
@@ -39,22 +58,43 @@ def stub_to_actual_context_set(stub_context, ignore_compiled=False):
     return contexts
 
 
-def _infer_from_stub(stub_module, qualified_names, ignore_compiled):
+def _follow_qualified_names(contexts, qualified_names):
+    for name in qualified_names:
+        contexts = contexts.py__getattribute__(name)
+    return contexts
+
+
+def _is_not_compiled(context):
+    return not context.is_compiled()
+
+
+def _get_non_stubs(stub_module, ignore_compiled):
     assert isinstance(stub_module, StubModuleContext), stub_module
     non_stubs = stub_module.non_stub_context_set
     if ignore_compiled:
-        non_stubs = non_stubs.filter(lambda c: not c.is_compiled())
-    for name in qualified_names:
-        non_stubs = non_stubs.py__getattribute__(name)
+        non_stubs = non_stubs.filter(_is_not_compiled)
     return non_stubs
 
 
-def try_stubs_to_actual_context_set(stub_contexts, prefer_stub_to_compiled=False):
-    contexts = ContextSet.from_sets(
-        stub_to_actual_context_set(stub_context, ignore_compiled=prefer_stub_to_compiled)
-        or ContextSet([stub_context])
-        for stub_context in stub_contexts
+def _infer_from_stub(stub_module, qualified_names, ignore_compiled):
+    return _follow_qualified_names(
+        _get_non_stubs(stub_module, ignore_compiled),
+        qualified_names
     )
+
+
+def try_stubs_to_actual_context_set(stub_contexts, prefer_stub_to_compiled=False):
+    context_list = []
+    for stub_context in stub_contexts:
+        actual_contexts = stub_to_actual_context_set(
+            stub_context,
+            ignore_compiled=prefer_stub_to_compiled
+        )
+        if actual_contexts:
+            context_list.extend(actual_contexts)
+        else:
+            context_list.append(stub_context)
+    contexts = ContextSet(context_list)
     debug.dbg('Stubs to actual: %s to %s', stub_contexts, contexts)
     return contexts
 
@@ -108,6 +148,7 @@ def name_to_stub(name):
     return ContextSet.from_sets(to_stub(c) for c in name.infer())
 
 
+@evaluator_method_cache()
 def to_stub(context):
     if context.is_stub():
         return ContextSet([context])
@@ -121,25 +162,9 @@ def to_stub(context):
     if stub_module is None or qualified_names is None:
         return NO_CONTEXTS
 
-    was_bound_method = context.is_bound_method()
-    if was_bound_method:
-        # Infer the object first. We can infer the method later.
-        method_name = qualified_names[-1]
-        qualified_names = qualified_names[:-1]
-        was_instance = True
-
-    stub_contexts = ContextSet([stub_module])
-    for name in qualified_names:
-        stub_contexts = stub_contexts.py__getattribute__(name)
-
-    if was_instance:
-        stub_contexts = ContextSet.from_sets(
-            c.execute_evaluated()
-            for c in stub_contexts
-            if c.is_class()
-        )
-    if was_bound_method:
-        # Now that the instance has been properly created, we can simply get
-        # the method.
-        stub_contexts = stub_contexts.py__getattribute__(method_name)
-    return stub_contexts
+    return _infer_qualified_names(
+        ContextSet([stub_module]),
+        context,
+        qualified_names,
+        was_instance,
+    )
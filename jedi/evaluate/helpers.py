@@ -194,16 +194,23 @@ def predefine_names(context, flow_scope, dct):
         del predefined[flow_scope]
 
 
-def is_string(context):
-    if context.evaluator.environment.version_info.major == 2:
-        str_classes = (unicode, bytes)
-    else:
-        str_classes = (unicode,)
-    return context.is_compiled() and isinstance(context.get_safe_value(default=None), str_classes)
+_PY2_STRING_CLASSES = (unicode, bytes)
 
 
-def is_literal(context):
-    return is_number(context) or is_string(context)
+def get_string_classes(evaluator):
+    """
+    Returns the types of string literals in the evaluated environment, usable
+    with ``isinstance``.
+    """
+    if evaluator.environment.version_info.major == 2:
+        return _PY2_STRING_CLASSES
+    # A single type instead of a tuple is a bit faster in isinstance.
+    return unicode
+
+
+def is_string(context):
+    str_classes = get_string_classes(context.evaluator)
+    return context.is_compiled() and isinstance(context.get_safe_value(default=None), str_classes)
 
 
 def _get_safe_value_or_none(context, accept):
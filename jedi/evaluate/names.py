@@ -8,6 +8,7 @@ from jedi.cache import memoize_method
 
 
 class AbstractNameDefinition(object):
+    __slots__ = ()
     start_pos = None
     string_name = None
     parent_context = None
@@ -32,7 +33,10 @@ class AbstractNameDefinition(object):
         raise NotImplementedError
 
     def get_root_context(self):
-        return self.parent_context.get_root_context()
+        context = self.parent_context
+        while context.parent_context is not None:
+            context = context.parent_context
+        return context
 
     def __repr__(self):
         if self.start_pos is None:
@@ -49,12 +53,19 @@ class AbstractNameDefinition(object):
 
 
 class AbstractTreeName(AbstractNameDefinition):
+    __slots__ = ('parent_context', 'tree_name', '_memoize_method_dct')
+
     def __init__(self, parent_context, tree_name):
         self.parent_context = parent_context
         self.tree_name = tree_name
 
+    @memoize_method
+    def _get_import_node(self):
+        return search_ancestor(self.tree_name, 'import_name', 'import_from')
+
+    @memoize_method
     def get_qualified_names(self, include_module_names=False):
-        import_node = search_ancestor(self.tree_name, 'import_name', 'import_from')
+        import_node = self._get_import_node()
         if import_node is not None:
             return tuple(n.value for n in import_node.get_path_for_name(self.tree_name))
 
@@ -73,8 +84,7 @@ class AbstractTreeName(AbstractNameDefinition):
         return self.parent_context.evaluator.goto(self.parent_context, self.tree_name)
 
     def is_import(self):
-        imp = search_ancestor(self.tree_name, 'import_from', 'import_name')
-        return imp is not None
+        return self._get_import_node() is not None
 
     @property
     def string_name(self):
@@ -86,9 +96,12 @@ class AbstractTreeName(AbstractNameDefinition):
 
 
 class ContextNameMixin(object):
+    __slots__ = ()
+
     def infer(self):
         return ContextSet([self._context])
 
+    @memoize_method
     def get_qualified_names(self, include_module_names=False):
         qualified_names = self._context.get_qualified_names()
         if qualified_names is None or not include_module_names:
@@ -110,6 +123,8 @@ class ContextNameMixin(object):
 
 
 class ContextName(ContextNameMixin, AbstractTreeName):
+    __slots__ = ('_context',)
+
     def __init__(self, context, tree_name):
         super(ContextName, self).__init__(context.parent_context, tree_name)
         self._context = context
@@ -120,6 +135,7 @@ class ContextName(ContextNameMixin, AbstractTreeName):
 
 
 class TreeNameDefinition(AbstractTreeName):
+    __slots__ = ()
     _API_TYPES = dict(
         import_name='module',
         import_from='module',
@@ -135,6 +151,7 @@ class TreeNameDefinition(AbstractTreeName):
         return tree_name_to_contexts(parent.evaluator, parent, self.tree_name)
 
     @property
+    @memoize_method
     def api_type(self):
         definition = self.tree_name.get_definition(import_name_always=True)
         if definition is None:
@@ -143,6 +160,8 @@ class TreeNameDefinition(AbstractTreeName):
 
 
 class ParamNameInterface(object):
+    __slots__ = ()
+
     def get_kind(self):
         raise NotImplementedError
 
@@ -151,15 +170,24 @@ class ParamNameInterface(object):
 
 
 class ParamName(AbstractTreeName, ParamNameInterface):
+    __slots__ = ()
     api_type = u'param'
 
     def __init__(self, parent_context, tree_name):
         self.parent_context = parent_context
         self.tree_name = tree_name
 
+    @memoize_method
     def _get_param_node(self):
         return search_ancestor(self.tree_name, 'param')
 
+    @memoize_method
+    def _get_position_index(self):
+        # Not just a simple attribute in parso, it searches the parameters of
+        # the function.
+        return self._get_param_node().position_index
+
+    @memoize_method
     def get_kind(self):
         tree_param = self._get_param_node()
         if tree_param.star_count == 1:  # *args
@@ -176,6 +204,7 @@ class ParamName(AbstractTreeName, ParamNameInterface):
                     break
         return Parameter.POSITIONAL_OR_KEYWORD
 
+    @memoize_method
     def to_string(self):
         output = self.string_name
         param_node = self._get_param_node()
@@ -190,11 +219,11 @@ class ParamName(AbstractTreeName, ParamNameInterface):
 
     def get_param(self):
         params, _ = self.parent_context.get_executed_params_and_issues()
-        param_node = search_ancestor(self.tree_name, 'param')
-        return params[param_node.position_index]
+        return params[self._get_position_index()]
 
 
 class ImportName(AbstractNameDefinition):
+    __slots__ = ('_from_module_context', 'string_name', '_memoize_method_dct')
     start_pos = (1, 0)
     _level = 0
 
@@ -214,6 +243,7 @@ class ImportName(AbstractNameDefinition):
         return ()
 
     @property
+    @memoize_method
     def parent_context(self):
         m = self._from_module_context
         import_contexts = self.infer()
@@ -238,10 +268,13 @@ class ImportName(AbstractNameDefinition):
 
 
 class SubModuleName(ImportName):
+    __slots__ = ()
     _level = 1
 
 
 class NameWrapper(object):
+    __slots__ = ('_wrapped_name',)
+
     def __init__(self, wrapped_name):
         self._wrapped_name = wrapped_name
 
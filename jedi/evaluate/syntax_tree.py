@@ -9,7 +9,7 @@ from jedi._compatibility import force_unicode, unicode
 from jedi import debug
 from jedi import parser_utils
 from jedi.evaluate.base_context import ContextSet, NO_CONTEXTS, ContextualizedNode, \
-    ContextualizedName, iterator_to_context_set, iterate_contexts
+    ContextualizedName, iterate_contexts
 from jedi.evaluate.lazy_context import LazyTreeContext
 from jedi.evaluate import compiled
 from jedi.evaluate import recursion
@@ -21,9 +21,9 @@ from jedi.evaluate.context import ClassContext, FunctionContext
 from jedi.evaluate.context import iterable
 from jedi.evaluate.context import TreeInstance
 from jedi.evaluate.finder import NameFinder
-from jedi.evaluate.helpers import is_string, is_literal, is_number
+from jedi.evaluate.helpers import is_number, get_string_classes
 from jedi.evaluate.compiled.access import COMPARISON_OPERATORS
-from jedi.evaluate.cache import evaluator_method_cache
+from jedi.evaluate.cache import evaluator_method_cache, evaluator_function_cache
 from jedi.evaluate.gradual.stub_context import VersionInfo
 from jedi.evaluate.gradual import annotation
 
@@ -362,37 +362,40 @@ def eval_or_test(context, or_test):
     return types
 
 
-@iterator_to_context_set
 def eval_factor(context_set, operator):
     """
     Calculates `+`, `-`, `~` and `not` prefixes.
     """
-    for context in context_set:
-        if operator == '-':
-            if is_number(context):
-                yield context.negate()
-        elif operator == 'not':
+    if operator == '-':
+        return ContextSet([context.negate() for context in context_set if is_number(context)])
+    elif operator == 'not':
+        contexts = []
+        for context in context_set:
             value = context.py__bool__()
             if value is None:  # Uncertainty.
-                return
-            yield compiled.create_simple_object(context.evaluator, not value)
-        else:
-            yield context
+                break
+            contexts.append(compiled.create_simple_object(context.evaluator, not value))
+        return ContextSet(contexts)
+    return context_set
 
 
 def _literals_to_types(evaluator, result):
     # Changes literals ('a', 1, 1.0, etc) to its type instances (str(),
     # int(), float(), etc).
-    new_result = NO_CONTEXTS
+    new_contexts = []
+    has_literals = False
     for typ in result:
-        if is_literal(typ):
+        if _get_operand_kind(typ) in _LITERAL_KINDS:
             # Literals are only valid as long as the operations are
             # correct. Otherwise add a value-free instance.
             cls = compiled.builtin_from_name(evaluator, typ.name.string_name)
-            new_result |= helpers.execute_evaluated(cls)
+            new_contexts += helpers.execute_evaluated(cls)
+            has_literals = True
         else:
-            new_result |= ContextSet([typ])
-    return new_result
+            new_contexts.append(typ)
+    if not has_literals:
+        return result
+    return ContextSet(new_contexts)
 
 
 def _eval_comparison(evaluator, context, left_contexts, operator, right_contexts):
@@ -401,17 +404,24 @@ def _eval_comparison(evaluator, context, left_contexts, operator, right_contexts
         result = (left_contexts or NO_CONTEXTS) | (right_contexts or NO_CONTEXTS)
         return _literals_to_types(evaluator, result)
     else:
+        left_length = len(left_contexts)
+        right_length = len(right_contexts)
+        if left_length == 1 and right_length == 1:
+            # The most common case, no need to combine multiple results.
+            left, = left_contexts
+            right, = right_contexts
+            return _eval_comparison_part(evaluator, context, left, operator, right)
         # I don't think there's a reasonable chance that a string
         # operation is still correct, once we pass something like six
         # objects.
-        if len(left_contexts) * len(right_contexts) > 6:
+        if left_length * right_length > 6:
             return _literals_to_types(evaluator, left_contexts | right_contexts)
         else:
-            return ContextSet.from_sets(
+            return ContextSet.from_sets([
                 _eval_comparison_part(evaluator, context, left, operator, right)
                 for left in left_contexts
                 for right in right_contexts
-            )
+            ])
 
 
 def _is_annotation_name(name):
@@ -430,14 +440,7 @@ def _is_annotation_name(name):
     return False
 
 
-def _is_tuple(context):
-    return isinstance(context, iterable.Sequence) and context.array_type == 'tuple'
-
-
-def _is_list(context):
-    return isinstance(context, iterable.Sequence) and context.array_type == 'list'
-
-
+@evaluator_function_cache()
 def _bool_to_context(evaluator, bool_):
     return compiled.builtin_from_name(evaluator, force_unicode(str(bool_)))
 
@@ -459,58 +462,115 @@ def _get_tuple_ints(context):
     return numbers
 
 
+_NUMBER = 'number'
+_STRING = 'string'
+_SEQUENCE = 'sequence'
+_LITERAL_KINDS = (_NUMBER, _STRING)
+
+
+def _get_operand_kind(context):
+    """
+    Returns whether an operand is a number, a string or a sequence (or None).
+    Getting the safe value of a compiled object is not cheap, so this is done
+    once per operand instead of once per check.
+    """
+    if isinstance(context, iterable.Sequence):
+        return _SEQUENCE
+    value = context.get_safe_value(default=None)
+    if isinstance(value, (int, float)):
+        return _NUMBER
+    if context.is_compiled() and isinstance(value, get_string_classes(context.evaluator)):
+        return _STRING
+    return None
+
+
+def _eval_multiply(evaluator, left, right, l_kind, r_kind, str_operator):
+    # for iterables, ignore * operations
+    if l_kind in (_SEQUENCE, _STRING):
+        return ContextSet([left])
+    elif r_kind in (_SEQUENCE, _STRING):
+        return ContextSet([right])
+    return None
+
+
+def _eval_add(evaluator, left, right, l_kind, r_kind, str_operator):
+    if l_kind == r_kind and l_kind in _LITERAL_KINDS:
+        return ContextSet([left.execute_operation(right, str_operator)])
+    elif l_kind == r_kind == _SEQUENCE \
+            and left.array_type == right.array_type in ('tuple', 'list'):
+        return ContextSet([iterable.MergedArray(evaluator, (left, right))])
+    return None
+
+
+def _eval_subtract(evaluator, left, right, l_kind, r_kind, str_operator):
+    if l_kind == r_kind == _NUMBER:
+        return ContextSet([left.execute_operation(right, str_operator)])
+    return None
+
+
+def _eval_modulo(evaluator, left, right, l_kind, r_kind, str_operator):
+    # With strings and numbers the left type typically remains. Except for
+    # `int() % float()`.
+    return ContextSet([left])
+
+
+def _eval_compare(evaluator, left, right, l_kind, r_kind, str_operator):
+    # Numbers and strings are always compiled objects, no need to ask again.
+    if l_kind in _LITERAL_KINDS and r_kind in _LITERAL_KINDS \
+            or left.is_compiled() and right.is_compiled():
+        # Possible, because the return is not an option. Just compare.
+        try:
+            return ContextSet([left.execute_operation(right, str_operator)])
+        except TypeError:
+            # Could be True or False.
+            pass
+    else:
+        if str_operator in ('is', '!=', '==', 'is not'):
+            operation = COMPARISON_OPERATORS[str_operator]
+            bool_ = operation(left, right)
+            return ContextSet([_bool_to_context(evaluator, bool_)])
+
+        if isinstance(left, VersionInfo):
+            version_info = _get_tuple_ints(right)
+            if version_info is not None:
+                bool_result = COMPARISON_OPERATORS[str_operator](
+                    evaluator.environment.version_info,
+                    tuple(version_info)
+                )
+                return ContextSet([_bool_to_context(evaluator, bool_result)])
+
+    return ContextSet([_bool_to_context(evaluator, True), _bool_to_context(evaluator, False)])
+
+
+def _eval_in(evaluator, left, right, l_kind, r_kind, str_operator):
+    return NO_CONTEXTS
+
+
+# Maps operators to functions returning a ContextSet, or None if the generic
+# fallback in ``_eval_comparison_part`` should be used.
+_OPERATOR_HANDLERS = {
+    '*': _eval_multiply,
+    '+': _eval_add,
+    '-': _eval_subtract,
+    '%': _eval_modulo,
+    'in': _eval_in,
+}
+_OPERATOR_HANDLERS.update((operator, _eval_compare) for operator in COMPARISON_OPERATORS)
+
+
 def _eval_comparison_part(evaluator, context, left, operator, right):
-    l_is_num = is_number(left)
-    r_is_num = is_number(right)
+    l_kind = _get_operand_kind(left)
+    r_kind = _get_operand_kind(right)
     if isinstance(operator, unicode):
         str_operator = operator
     else:
         str_operator = force_unicode(str(operator.value))
 
-    if str_operator == '*':
-        # for iterables, ignore * operations
-        if isinstance(left, iterable.Sequence) or is_string(left):
-            return ContextSet([left])
-        elif isinstance(right, iterable.Sequence) or is_string(right):
-            return ContextSet([right])
-    elif str_operator == '+':
-        if l_is_num and r_is_num or is_string(left) and is_string(right):
-            return ContextSet([left.execute_operation(right, str_operator)])
-        elif _is_tuple(left) and _is_tuple(right) or _is_list(left) and _is_list(right):
-            return ContextSet([iterable.MergedArray(evaluator, (left, right))])
-    elif str_operator == '-':
-        if l_is_num and r_is_num:
-            return ContextSet([left.execute_operation(right, str_operator)])
-    elif str_operator == '%':
-        # With strings and numbers the left type typically remains. Except for
-        # `int() % float()`.
-        return ContextSet([left])
-    elif str_operator in COMPARISON_OPERATORS:
-        if left.is_compiled() and right.is_compiled():
-            # Possible, because the return is not an option. Just compare.
-            try:
-                return ContextSet([left.execute_operation(right, str_operator)])
-            except TypeError:
-                # Could be True or False.
-                pass
-        else:
-            if str_operator in ('is', '!=', '==', 'is not'):
-                operation = COMPARISON_OPERATORS[str_operator]
-                bool_ = operation(left, right)
-                return ContextSet([_bool_to_context(evaluator, bool_)])
-
-            if isinstance(left, VersionInfo):
-                version_info = _get_tuple_ints(right)
-                if version_info is not None:
-                    bool_result = compiled.access.COMPARISON_OPERATORS[operator](
-                        evaluator.environment.version_info,
-                        tuple(version_info)
-                    )
-                    return ContextSet([_bool_to_context(evaluator, bool_result)])
-
-        return ContextSet([_bool_to_context(evaluator, True), _bool_to_context(evaluator, False)])
-    elif str_operator == 'in':
-        return NO_CONTEXTS
+    handler = _OPERATOR_HANDLERS.get(str_operator)
+    if handler is not None:
+        result = handler(evaluator, left, right, l_kind, r_kind, str_operator)
+        if result is not None:
+            return result
 
     def check(obj):
         """Checks if a Jedi object is either a float or an int."""
@@ -518,7 +578,7 @@ def _eval_comparison_part(evaluator, context, left, operator, right):
             obj.name.string_name in ('int', 'float')
 
     # Static analysis, one is a number, the other one is not.
-    if str_operator in ('+', '-') and l_is_num != r_is_num \
+    if str_operator in ('+', '-') and (l_kind == _NUMBER) != (r_kind == _NUMBER) \
             and not (check(left) or check(right)):
         message = "TypeError: unsupported operand type(s) for +: %s and %s"
         analysis.add(context, 'type-error-operation', operator,
@@ -14,7 +14,7 @@ import parso
 from jedi._compatibility import force_unicode
 from jedi.plugins.base import BasePlugin
 from jedi import debug
-from jedi.evaluate.helpers import get_str_or_none
+from jedi.evaluate.helpers import get_str_or_none, is_string
 from jedi.evaluate.arguments import ValuesArguments, \
     repack_with_argument_clinic, AbstractArguments, TreeArgumentsWrapper
 from jedi.evaluate import analysis
@@ -28,7 +28,6 @@ from jedi.evaluate.context import ClassContext, ModuleContext, \
 from jedi.evaluate.context import iterable
 from jedi.evaluate.lazy_context import LazyTreeContext, LazyKnownContext, \
     LazyKnownContexts
-from jedi.evaluate.syntax_tree import is_string
 from jedi.evaluate.filters import AttributeOverwrite, publish_method
 
 
@@ -140,3 +140,14 @@ def test_async(Script, environment):
 
 def test_with_stmt_error_recovery(Script):
     assert Script('with open('') as foo: foo.\na', line=1).completions()
+
+
+def test_goto_definitions_after_completion(Script):
+    """
+    The speed hacks for completions without ``.`` or ``(`` must not leak into
+    later name lookups.
+    """
+    code = 'foo = 3\nfo'
+    assert 'foo' in [c.name for c in Script(code).completions()]
+    def_, = Script('foo = 3\nfoo').goto_definitions()
+    assert def_.name == 'int'
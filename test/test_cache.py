@@ -1,6 +1,19 @@
 """
 Test all things related to the ``jedi.cache`` module.
 """
+import pytest
+
+from jedi.cache import memoize_method
+
+
+class _Counter(object):
+    def __init__(self):
+        self.calls = 0
+
+    @memoize_method
+    def get(self, value=None):
+        self.calls += 1
+        return self.calls, value
 
 
 def test_cache_call_signatures(Script):
@@ -27,3 +40,67 @@ def test_cache_call_signatures(Script):
 def test_cache_line_split_issues(Script):
     """Should still work even if there's a newline."""
     assert Script('int(\n').call_signatures()[0].name == 'int'
+
+
+def test_memoize_method_arguments():
+    counter = _Counter()
+    assert counter.get() == (1, None)
+    assert counter.get() == (1, None)
+    assert counter.get(3) == (2, 3)
+    assert counter.get(3) == (2, 3)
+    # Positional and keyword arguments are cached separately.
+    assert counter.get(value=3) == (3, 3)
+    assert counter.get(value=3) == (3, 3)
+    assert counter.calls == 3
+
+
+def test_memoize_method_slots():
+    class Slotted(object):
+        __slots__ = ('calls', '_memoize_method_dct')
+
+        def __init__(self):
+            self.calls = 0
+
+        @memoize_method
+        def get(self):
+            self.calls += 1
+            return self.calls
+
+    slotted = Slotted()
+    assert slotted.get() == 1
+    assert slotted.get() == 1
+    assert Slotted().get() == 1
+
+
+def test_memoize_method_slots_without_cache_slot():
+    class Slotted(object):
+        __slots__ = ()
+
+        @memoize_method
+        def get(self):
+            return 1
+
+    with pytest.raises(AttributeError) as excinfo:
+        Slotted().get()
+    assert '_memoize_method_dct' in str(excinfo.value)
+
+
+def test_memoize_method_wrapper_with_getattr():
+    class Wrapper(object):
+        def __init__(self, wrapped):
+            self._wrapped = wrapped
+
+        def __getattr__(self, name):
+            return getattr(self._wrapped, name)
+
+        @memoize_method
+        def get(self):
+            return 'wrapper'
+
+    counter = _Counter()
+    counter.get()
+    wrapper = Wrapper(counter)
+    assert wrapper.get() == 'wrapper'
+    # The wrapper must not use the cache of the wrapped object.
+    assert len(counter._memoize_method_dct) == 1
+    assert wrapper._memoize_method_dct is not counter._memoize_method_dct